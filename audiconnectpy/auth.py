@@ -69,6 +69,7 @@ class Auth:
         self._mbb_token: dict[str, Any] = {}
         self._here_token: dict[str, Any] = {}
         self._mbb_token_expired: datetime | None = None
+        self._refresh_lock = asyncio.Lock()
         self._idk_token: dict[str, str] = {}
         self._audi_token: dict[str, str] = {}
         self.uris: dict[str, str] = {}
@@ -116,7 +117,7 @@ class Auth:
             return response
 
         if "application/json" in response.headers.get("Content-Type", ""):
-            rsp = await response.json()
+            rsp = json.loads(contents) if contents.strip() else None
         elif (
             (headers := kwargs.get("headers"))
             and "application/json" in headers.get("Accept", "")
@@ -302,7 +303,14 @@ class Auth:
 
     async def async_refresh_tokens(self) -> None:
         """Refresh token if."""
-        if self._mbb_token_expired and datetime.now() > self._mbb_token_expired:
+        if not self._is_mbb_token_expired():
+            return
+
+        async with self._refresh_lock:
+            # Another caller may have refreshed while waiting for the lock
+            if not self._is_mbb_token_expired():
+                return
+
             try:
                 _LOGGER.debug("Refresh MBB token")
                 refresh_token = self._mbb_token["refresh_token"]
@@ -339,6 +347,13 @@ class Auth:
                 _LOGGER.error("Refresh token failed: %s", error)
                 self.binded = False
 
+    def _is_mbb_token_expired(self) -> bool:
+        """Return True if the MBB token must be refreshed."""
+        return (
+            self._mbb_token_expired is not None
+            and datetime.now() > self._mbb_token_expired
+        )
+
     async def async_get_action_headers(
         self, content_type: str, security_token: str | None, x_security: bool = False
     ) -> dict[str, str]:
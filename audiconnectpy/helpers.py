@@ -13,16 +13,18 @@ import re
 import time
 from typing import Any
 
-from pydantic import SerializationInfo
-
 from .exceptions import TimeoutExceededError
 
 _LOGGER = logging.getLogger(__name__)
 
+_CAMEL_BOUNDARY = re.compile(r"(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])")
+
 
 class ExtendedDict(dict[Any, Any]):
     """Extend dictionary class."""
 
+    __slots__ = ()
+
     def getr(self, keys: str, default: Any = None) -> Any:
         """Get recursive attribute."""
         reduce_value: Any = reduce(
@@ -144,16 +146,32 @@ def state_control(
     return metadata
 
 
-def windows_status(
-    value: Any, handler: Callable[..., Any], info: SerializationInfo
-) -> dict[str, bool]:
+def is_active(value: str) -> bool:
+    """Active state."""
+    return value.lower() == "active"
+
+
+def is_charging(value: str) -> bool:
+    """Charging state."""
+    return value.lower() == "charging"
+
+
+def is_connected(value: str) -> bool:
+    """Connected state."""
+    return value.lower() == "connected"
+
+
+def is_locked(value: str) -> bool:
+    """Locked state."""
+    return value.lower() == "locked"
+
+
+def windows_status(value: Any) -> dict[str, bool]:
     """Windows open status."""
     return state_control(value, "closed")
 
 
-def doors_status(
-    value: Any, handler: Callable[..., Any], info: SerializationInfo
-) -> dict[str, dict[str, bool]]:
+def doors_status(value: Any) -> dict[str, dict[str, bool]]:
     """Doors lock status."""
     return {
         "locked": state_control(value, "locked"),
@@ -161,22 +179,19 @@ def doors_status(
     }
 
 
-def window_heating_status(
-    value: Any, handler: Callable[..., Any], info: SerializationInfo
-) -> dict[str, bool]:
+def window_heating_status(value: Any) -> dict[str, bool]:
     return state_control(value, "on", "windowLocation", "windowHeatingState")
 
 
-def lights_status(
-    value: Any, handler: Callable[..., Any], info: SerializationInfo
-) -> dict[str, bool]:
+def lights_status(value: Any) -> dict[str, bool]:
     """Light status."""
     return state_control(value, "on")
 
 
+@functools.lru_cache(maxsize=1024)
 def camel2snake(name: str) -> str:
     """Camel case to Snake case."""
-    return re.sub(r"(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])", "_", name).lower()
+    return _CAMEL_BOUNDARY.sub("_", name).lower()
 
 
 def remove_value(obj: dict[str, Any]) -> dict[str, Any]:
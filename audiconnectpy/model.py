@@ -3,41 +3,44 @@
 from __future__ import annotations
 
 from datetime import datetime
+import sys
 from typing import Any, Literal
 
 from pydantic import (
+    AfterValidator,
     AliasPath,
     BaseModel,
     ConfigDict,
     Field,
     PlainSerializer,
-    WrapSerializer,
 )
 from pydantic.alias_generators import to_camel
 from pydantic_extra_types.coordinate import Latitude, Longitude
 from typing_extensions import Annotated
 
-from .helpers import doors_status, lights_status, window_heating_status, windows_status
+from .helpers import (
+    doors_status,
+    is_active,
+    is_charging,
+    is_connected,
+    is_locked,
+    lights_status,
+    window_heating_status,
+    windows_status,
+)
 
-TActived = Annotated[
-    str, PlainSerializer(lambda x: x.lower() == "active", return_type=bool)
-]
-TCharging = Annotated[
-    str, PlainSerializer(lambda x: x.lower() == "charging", return_type=bool)
-]
-TConnected = Annotated[
-    str, PlainSerializer(lambda x: x.lower() == "connected", return_type=bool)
-]
-TDoorLocked = Annotated[list, WrapSerializer(doors_status, return_type=dict)]
+TActived = Annotated[str, PlainSerializer(is_active, return_type=bool)]
+TCharging = Annotated[str, PlainSerializer(is_charging, return_type=bool)]
+TConnected = Annotated[str, PlainSerializer(is_connected, return_type=bool)]
+TDoorLocked = Annotated[list, PlainSerializer(doors_status, return_type=dict)]
 
-TLocked = Annotated[
-    str, PlainSerializer(lambda x: x.lower() == "locked", return_type=bool)
-]
-TWindowOpened = Annotated[list, WrapSerializer(windows_status, return_type=dict)]
+TLocked = Annotated[str, PlainSerializer(is_locked, return_type=bool)]
+TWindowOpened = Annotated[list, PlainSerializer(windows_status, return_type=dict)]
 TWindowHeating = Annotated[
-    list, WrapSerializer(window_heating_status, return_type=dict)
+    list, PlainSerializer(window_heating_status, return_type=dict)
 ]
-TLights = Annotated[list, WrapSerializer(lights_status, return_type=dict)]
+TLights = Annotated[list, PlainSerializer(lights_status, return_type=dict)]
+TInterned = Annotated[str, AfterValidator(sys.intern)]
 
 
 # SECTION
@@ -69,7 +72,7 @@ class AccessStatus(Base):
     """Return accessStatus."""
 
     car_captured_timestamp: datetime
-    overall_status: str | None = None
+    overall_status: TInterned | None = None
     door_lock_status: TLocked | None = None
     doors: TDoorLocked | None = None  # type: ignore
     windows: TWindowOpened | None = None  # type: ignore
@@ -95,6 +98,8 @@ class Charging(Base):
 
 
 class BatteryStatus(Base):
+    model_config = ConfigDict(frozen=True)
+
     current_soc_pct: int | None = Field(default=None, alias="currentSOC_pct")
     cruising_range_electric_km: int | None = Field(
         default=None, alias="cruisingRangeElectric_km"
@@ -106,7 +111,7 @@ class ChargingStatus(Base):
         default=None, alias="remaining_charging_time_to_complete_min"
     )
     charging_state: TCharging | None = None
-    charge_mode: str | None = None
+    charge_mode: TInterned | None = None
     charge_power_kw: float | None = Field(default=None, alias="chargePower_kW")
     charge_rate_kmph: int | None = Field(default=None, alias="chargeRate_kmph")
     charge_type: str | None = None
@@ -124,7 +129,7 @@ class PlugStatus(Base):
     plug_connection_state: TConnected | None = None
     plug_lock_state: TLocked | None = None
     external_power: TActived | None = None
-    led_color: str | None = None
+    led_color: TInterned | None = None
 
 
 class ChargeMode(Base):
@@ -155,7 +160,7 @@ class ClimatisationStatus(Base):
 class ClimatisationSettings(Base):
     target_temperature_c: int | None = Field(default=None, alias="targetTemperature_C")
     target_temperature_f: int | None = Field(default=None, alias="targetTemperature_F")
-    unit_in_car: str | None = None
+    unit_in_car: TInterned | None = None
     climatization_at_unlock: bool | None = None
     window_heating_enabled: bool | None = None
     zone_front_left_enabled: bool | None = None
@@ -181,12 +186,16 @@ class ClimatisationTimersStatus(Base):
 
 
 class Timer(Base):
+    model_config = ConfigDict(frozen=True)
+
     id: int
     enabled: bool
     single_timer: SingleTimer
 
 
 class SingleTimer(Base):
+    model_config = ConfigDict(frozen=True)
+
     start: datetime | None = Field(alias="start_date_time", default=None)
     target: datetime | None = Field(alias="target_date_time", default=None)
     start_local: datetime | None = Field(alias="start_date_time_local", default=None)
@@ -201,7 +210,7 @@ class FuelStatus(Base):
 
 
 class FuelRangeStatus(Base):
-    car_type: str | None = None
+    car_type: TInterned | None = None
     primary_engine: PrimaryEngine | None = None
     secondary_engine: SecondaryEngine | None = None
     total_range_km: int | None = Field(default=None, alias="totalRange_km")
@@ -286,6 +295,8 @@ class RangeStatus(Base):
 
 
 class OdometerStatus(Base):
+    model_config = ConfigDict(frozen=True)
+
     odometer: int | None = None
 
 
@@ -296,10 +307,12 @@ class FuelLevelStatus(Base):
     )
     primary_engine_type: str | None = None
     secondary_engine_type: str | None = None
-    car_type: str | None = None
+    car_type: TInterned | None = None
 
 
 class TemperatureBatteryStatus(Base):
+    model_config = ConfigDict(frozen=True)
+
     temperature_hv_battery_max_k: float | None = Field(
         default=None, alias="temperatureHvBatteryMax_K"
     )
@@ -333,6 +346,8 @@ class Address(Base):
 
 # SECTION
 class Position(Base):
+    model_config = ConfigDict(frozen=True)
+
     longitude: Longitude | None = Field(
         validation_alias=AliasPath("data", "lon"), default=None
     )
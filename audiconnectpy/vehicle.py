@@ -98,21 +98,36 @@ class Vehicle:
         except AudiException:
             self.capabilities_supported = False
 
-        # Get information
         try:
-            infos = await self.async_get_information()
-            data.update({"infos": infos})
-        except (AttributeError, AudiException) as error:
-            raise AudiException(error) from error
+            async with asyncio.TaskGroup() as group:
+                infos = group.create_task(self.async_get_information())
+                selectivestatus = group.create_task(self.async_get_selectivestatus())
+                position = group.create_task(self._async_update_position())
+                location = group.create_task(self._async_update_location())
+                group.create_task(self._async_update_trips())
+        except ExceptionGroup as errors:
+            error = errors.exceptions[0]
+            if isinstance(error, (AttributeError, AudiException)):
+                raise AudiException(error) from error
+            raise error from errors
+
+        data.update({"infos": infos.result()})
+        data.update(selectivestatus.result())
+        data.update(position.result())
+        data.update(location.result())
 
-        # Selective status
+        # Load data model
         try:
-            selectivestatus = await self.async_get_selectivestatus()
-            data.update(selectivestatus)
-        except (AttributeError, AudiException) as error:
+            vehicle_model = Model.model_validate(data)
+        except ValidationError as error:
             raise AudiException(error) from error
+        else:
+            for attr, obj in vehicle_model.model_dump().items():
+                setattr(self, attr, obj)
 
-        # Position
+    async def _async_update_position(self) -> dict[str, Any]:
+        """Get position and update its support state."""
+        data = {}
         try:
             if self.position_supported is not False:
                 position = await self.async_get_position()
@@ -128,8 +143,11 @@ class Vehicle:
         except AudiException as error:
             logger.debug(error)
             self.position_supported = False
+        return data
 
-        # Locations (here.com)
+    async def _async_update_location(self) -> dict[str, Any]:
+        """Get locations (here.com) and update their support state."""
+        data = {}
         try:
             if self.locations_supported is not False:
                 if location := await self.async_get_location():
@@ -141,8 +159,10 @@ class Vehicle:
         except AudiException as error:
             logger.debug(error)
             self.locations_supported = False
+        return data
 
-        # Trips
+    async def _async_update_trips(self) -> None:
+        """Update trips support state."""
         try:
             await self.async_get_trip_last()
             self.trips_supported = True
@@ -150,17 +170,6 @@ class Vehicle:
             logger.debug(error)
             self.trips_supported = False
 
-        # Load data model
-        try:
-            vehicle_model = Model(**data)
-        except ValidationError as error:
-            raise AudiException(error) from error
-        else:
-            model = dict(vehicle_model.model_dump())
-            for attr in model:
-                obj = model.get(attr)
-                setattr(self, attr, obj)
-
     async def async_get_information(self) -> Any:
         """Get information vehicles."""
         language = self.uris["language"]
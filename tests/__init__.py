@@ -24,4 +24,5 @@ def mock_response(resp_data=None, status_code=200) -> Generator[AsyncMock, None,
     mock.return_value.headers = CIMultiDict({("Content-Type", "application/json")})
     mock.return_value.status = status_code
     mock.return_value.json = AsyncMock(return_value=resp_data)
+    mock.return_value.read = AsyncMock(return_value=json.dumps(resp_data).encode())
     return mock
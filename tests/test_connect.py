@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+from datetime import datetime, timedelta
 import logging
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 from aiohttp import ClientSession
 from multidict import CIMultiDict
@@ -148,3 +150,33 @@ async def test_get_vehicles(connect, update, vehicles, uris) -> None:
         assert api.vehicles is not None
         assert api.vehicles[0].fill_region.url == "fal-xxx"
         assert api.vehicles[0].fill_region.url_setter == "mal-xxx"
+
+
+async def test_refresh_tokens_once() -> None:
+    """Test concurrent callers refresh an expired token only once."""
+    api = AudiConnect(
+        session=ClientSession(), username=USR, password=PWD, country=COUNTRY, spin=SPIN
+    )
+    api.auth._mbb_token = {"refresh_token": "refresh_token"}
+    api.auth._idk_token = {"refresh_token": "refresh_token", "id_token": "id_token"}
+    api.auth._mbb_token_expired = datetime.now() - timedelta(seconds=1)
+
+    async def get_mbb_token(refresh_token: str) -> dict[str, str | int]:
+        await asyncio.sleep(0)
+        return {"refresh_token": "new_refresh_token", "expires_in": 3600}
+
+    mbb_token = AsyncMock(side_effect=get_mbb_token)
+    with (
+        patch("audiconnectpy.auth.Auth._async_get_mbb_token", mbb_token),
+        patch(
+            "audiconnectpy.auth.Auth._async_get_idk_token",
+            return_value={"refresh_token": "refresh_token", "id_token": "id_token"},
+        ),
+        patch("audiconnectpy.auth.Auth._async_get_azs_token", return_value={}),
+        patch("audiconnectpy.auth.Auth._async_get_here_token", return_value={}),
+    ):
+        await asyncio.gather(
+            api.auth.async_refresh_tokens(), api.auth.async_refresh_tokens()
+        )
+
+    mbb_token.assert_awaited_once()
@@ -263,3 +263,122 @@ async def test_vehicle_3(
         assert my_vehicle.position_supported is False
         assert my_vehicle.locations_supported is False
         assert my_vehicle.capabilities_supported is True
+
+
+@patch("audiconnectpy.auth.Auth.async_connect")
+@patch("audiconnectpy.api.AudiConnect._async_fill_url")
+async def test_vehicle_update_failed(
+    connect,
+    fill_url,
+    information,
+    vehicles,
+    vehicle_0,
+    position,
+    location,
+    capabilities,
+    uris,
+) -> None:
+    """Test update raises when information or selective status fails."""
+    api = AudiConnect(
+        session=ClientSession(), username=USR, password=PWD, country=COUNTRY, spin=SPIN
+    )
+
+    with (
+        patch(
+            "audiconnectpy.api.AudiConnect.async_get_vehicles",
+            return_value=vehicles,
+        ),
+        patch(
+            "audiconnectpy.vehicle.Vehicle.async_get_selectivestatus",
+            return_value=vehicle_0,
+        ),
+        patch(
+            "audiconnectpy.vehicle.Vehicle.async_get_information",
+            return_value=information,
+        ),
+        patch(
+            "audiconnectpy.vehicle.Vehicle.async_get_position",
+            return_value=position,
+        ),
+        patch(
+            "audiconnectpy.vehicle.Vehicle.async_get_location",
+            return_value=location,
+        ),
+        patch(
+            "audiconnectpy.vehicle.Vehicle.async_get_capabilities",
+            return_value=capabilities,
+        ),
+    ):
+        api.auth.uris = uris
+        await api.async_login()
+        my_vehicle = api.vehicles[0]
+
+        with (
+            patch(
+                "audiconnectpy.vehicle.Vehicle.async_get_information",
+                side_effect=AudiException("error"),
+            ),
+            pytest.raises(AudiException),
+        ):
+            await my_vehicle.async_update()
+
+        with (
+            patch(
+                "audiconnectpy.vehicle.Vehicle.async_get_selectivestatus",
+                side_effect=AudiException("error"),
+            ),
+            pytest.raises(AudiException),
+        ):
+            await my_vehicle.async_update()
+
+
+@patch("audiconnectpy.auth.Auth.async_connect")
+@patch("audiconnectpy.api.AudiConnect._async_fill_url")
+async def test_vehicle_position_location_unsupported(
+    connect,
+    fill_url,
+    information,
+    vehicles,
+    vehicle_0,
+    capabilities,
+    uris,
+) -> None:
+    """Test position and location failures do not fail the update."""
+    api = AudiConnect(
+        session=ClientSession(), username=USR, password=PWD, country=COUNTRY, spin=SPIN
+    )
+
+    with (
+        patch(
+            "audiconnectpy.api.AudiConnect.async_get_vehicles",
+            return_value=vehicles,
+        ),
+        patch(
+            "audiconnectpy.vehicle.Vehicle.async_get_selectivestatus",
+            return_value=vehicle_0,
+        ),
+        patch(
+            "audiconnectpy.vehicle.Vehicle.async_get_information",
+            return_value=information,
+        ),
+        patch(
+            "audiconnectpy.vehicle.Vehicle.async_get_position",
+            side_effect=AudiException("error"),
+        ),
+        patch(
+            "audiconnectpy.vehicle.Vehicle.async_get_location",
+            side_effect=AudiException("error"),
+        ),
+        patch(
+            "audiconnectpy.vehicle.Vehicle.async_get_capabilities",
+            return_value=capabilities,
+        ),
+    ):
+        api.auth.uris = uris
+        await api.async_login()
+        my_vehicle = api.vehicles[0]
+
+        assert my_vehicle.position_supported is False
+        assert my_vehicle.locations_supported is False
+        assert my_vehicle.access is not None
+        assert my_vehicle.position is None